@@ -56,9 +56,9 @@ class Simulation(object):
             end: timestamp or date. If `None`, go to end of ticker data.
         """
         if start is None:
-            start = self.strategy.candles.iloc[0].name
+            start = self.strategy.candles.index[0]
         if end is None:
-            end = self.strategy.candles.iloc[-1].name
+            end = self.strategy.candles.index[-1]
 
         msg = "Starting simulation"
         logging.info(msg)
@@ -75,10 +75,10 @@ class Simulation(object):
         logging.info(msg)
         print(msg)
         points = pd.date_range(start, end, freq=freq, tz=TZ)
-        for i, _point in enumerate(points):
+        for i, value in enumerate(points.asi8):
 
-            # remove `freq` attribute
-            point = pd.Timestamp.fromtimestamp(_point.timestamp(), tz=TZ)
+            # construct from nanoseconds to remove `freq` attribute without a round-trip through a POSIX timestamp
+            point = pd.Timestamp(value, tz=TZ)
 
             # TODO: enable multithreading
             self.print_progress(i)
@@ -97,9 +97,9 @@ class Simulation(object):
             end: date or timestamp to end plot
         """
         if start is None:
-            start = self.strategy.candles.iloc[0].name
+            start = self.strategy.candles.index[0]
         if end is None:
-            end = self.strategy.candles.iloc[-1].name
+            end = self.strategy.candles.index[-1]
 
         self.strategy.candles.loc[start:end]['close'].plot(color='blue')
 
@@ -1,18 +1,55 @@
 import concurrent.futures
-from math import ceil, nan
+from datetime import datetime
+from functools import cached_property
+from math import ceil, isnan, nan
+import multiprocessing
+import numpy as np
 import pandas as pd
-from typing import Mapping, Optional, NoReturn, Union
+from typing import Dict, List, Mapping, Optional, NoReturn, Tuple, Union
 
 from core import MarketAPI
 from misc import TZ
 from models.indicators import MACDRow, BBANDSRow, STOCHRSIRow
-from models import FrequencySignal
+from models import FrequencySignal, Indicator
 from primitives import TrendDirection, MarketTrend, Signal
 
 
 STRONG_THRESHOLD = 3
 """ This is a scalar value which determines whether a trend is strong or not. """
 
+_POINTS_CACHE_SIZE = 4096
+""" Maximum number of timestamps memoized by `TrendDetector._process_points()` """
+
+
+def _update_worker(indicators: List['Indicator'], candles: pd.DataFrame) -> List['Indicator']:
+    """ Compute indicator data for a single frequency.
+
+    Notes:
+        This is defined at module-level so that it may be pickled by `ProcessPoolExecutor`. Only `Indicator` objects
+        and candle data are sent to the worker since `FrequencySignal` holds a reference to the market.
+
+    Returns:
+        `indicators` with populated `graph` and `computed` attributes. These are copies and must be re-assigned to the
+        originating container.
+    """
+    for indicator in indicators:
+        indicator.process(candles)
+    for indicator in indicators:
+        indicator.compute(candles)
+    return indicators
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """ Start method used for computing indicators in separate processes.
+
+    Notes:
+        'fork' is avoided since `TrendDetector` may hold a running thread pool, and forking a multi-threaded process is
+        unsafe. 'forkserver' is preferred over 'spawn' since it does not re-import the parent for every worker.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
 
 class TrendDetector(object):
     """ An independent object that provides foresight by encapsulating analysis of market trends.
@@ -34,24 +71,78 @@ class TrendDetector(object):
     Shall be ordered from shortest-to-longest.
     """
 
-    def __init__(self, market: MarketAPI, threads: int = 0, lookback: int = 1):
+    def __init__(self, market: MarketAPI, threads: int = 0, lookback: int = 1, processes: bool = False):
+        """
+        Args:
+            market:
+                Platform market to operate on.
+            threads:
+                Number of threads to use per frequency. `0` disables threading and is meant to be used while debugging.
+                Capped at the number of indicators per frequency to avoid oversubscription.
+            lookback:
+                Number of signal repetition to convert signal time-series data to `Signal` objects.
+            processes:
+                Flag to compute indicators for each frequency in a separate process during `update()`. Since indicator
+                computation is CPU-bound, this side-steps the GIL. Overrides `threads` during `update()`. Worker
+                processes persist until `close()` is called.
+        """
         super().__init__()
 
         self.market = market
         self.threads = threads
         self.lookback = lookback
+        self.processes = processes
 
         self._indicators: Mapping[str, 'FrequencySignal'] = self._create_indicator_container()
         """ Store indicator data as a mapping where each key is a frequency.
         """
 
-    @property
-    def graph(self):
-        return pd.concat([i.graph for i in self._indicators.values()], keys=self._frequencies)
-
-    @property
-    def computed(self):
-        return pd.concat([i.computed for i in self._indicators.values()], keys=self._frequencies)
+        if threads:
+            # each frequency submits one task per indicator, so any additional threads would only sit idle
+            threads = min(threads, max(len(i.indicators) for i in self._indicators.values()))
+            self.threads = threads
+            for container in self._indicators.values():
+                container.threads = threads
+
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        """ Thread pool shared by all calls. Only created when `threads` is non-zero. Released by `close()`. """
+        if threads:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=threads * len(self._frequencies),
+                                                                   thread_name_prefix='trend')
+
+        self._process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        """ Process pool used by `update()` when `processes` is set. Created on first use. Released by `close()`. """
+
+        self._characterize_cache: Tuple[Optional[pd.Timestamp], Optional[MarketTrend]] = (None, None)
+        """ Last timestamp and result of `characterize()` when called without `point`. Cleared by `update()`. """
+
+        self._points: Dict[pd.Timestamp, Dict[str, Union['pd.Timestamp', str]]] = {}
+        """ Memoized values of `_process_points()`. Cleared by `update()`. """
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> NoReturn:
+        """ Shutdown thread and process pools. """
+        executor = getattr(self, '_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+            self._executor = None
+
+        pool = getattr(self, '_process_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+            self._process_pool = None
+
+    @cached_property
+    def graph(self) -> pd.DataFrame:
+        """ Indicator data for all frequencies. Cached until `update()` is called. """
+        return pd.concat([i.graph for i in self._indicators.values()], keys=self._indicators.keys())
+
+    @cached_property
+    def computed(self) -> pd.DataFrame:
+        """ Computed signals and strengths for all frequencies. Cached until `update()` is called. """
+        return pd.concat([i.computed for i in self._indicators.values()], keys=self._indicators.keys())
 
     def _create_indicator_container(self) -> Mapping[str, 'FrequencySignal']:
         indicators = {}
@@ -66,11 +157,30 @@ class TrendDetector(object):
 
         Reduces boilerplate for returning cleaned data.
         """
-        assert frequency in self._frequencies
+        # `_indicators` is keyed by `_frequencies`, and provides a constant-time lookup
+        assert frequency in self._indicators
 
         # fetch via multi-index
         return self.market.candles(frequency)
 
+    def _process_points(self, point: pd.Timestamp) -> Dict[str, Union['pd.Timestamp', str]]:
+        """ Quantize `point` for every frequency via `market.process_point()`.
+
+        Results are memoized since the same point is used by both `_fetch_trend()` and `_determine_scalar()`, and
+        since backtesting characterizes the same points repeatedly. The cache is cleared by `update()` because the
+        value returned by `process_point()` may depend on available candle data.
+
+        Returns:
+            Mapping of frequency to quantized point
+        """
+        points = self._points.get(point)
+        if points is None:
+            if len(self._points) >= _POINTS_CACHE_SIZE:
+                self._points.clear()
+            points = {freq: self.market.process_point(point, freq) for freq in self._indicators.keys()}
+            self._points[point] = points
+        return points
+
     def update(self) -> NoReturn:
         """ Compute all indicator functions across all frequencies using existing candle data.
 
@@ -83,14 +193,36 @@ class TrendDetector(object):
         """
         assert len(self._indicators) != 0
 
-        if self.threads:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads * len(self._frequencies)) as executor:
-                fs = []
-                for container in self._indicators.values():
-                    fs.append(executor.submit(container.update))
-                concurrent.futures.wait(fs)
+        self._characterize_cache = (None, None)
+        self._points.clear()
+
+        # invalidate `graph` and `computed`
+        self.__dict__.pop('graph', None)
+        self.__dict__.pop('computed', None)
+
+        if self.processes:
+            # worker processes are reused since starting a process costs far more than a single update
+            if self._process_pool is None:
+                self._process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=len(self._indicators),
+                                                                            mp_context=_mp_context())
+            fs = {}
+            for freq, container in self._indicators.items():
+                candles = self.candles(freq)
+                fs[freq] = self._process_pool.submit(_update_worker, container.indicators, candles)
+                container.last_update = candles.index[-1]
+            for freq, future in fs.items():
+                self._indicators[freq].indicators = future.result()
+        elif self.threads:
+            fs = []
+            for container in self._indicators.values():
+                fs.append(self._executor.submit(container.update))
+
+            # propagate any exception raised by workers
+            for future in fs:
+                future.result()
         else:
-            [container.update() for container in self._indicators.values()]
+            for container in self._indicators.values():
+                container.update()
 
     def _fetch_trend(self, point: pd.Timestamp,
                      executor: concurrent.futures.Executor = None,
@@ -111,26 +243,25 @@ class TrendDetector(object):
             If `raw` is True, a `pd.Series` of `Signal` values are returned. Otherwise, the mode of such a `Series` is
             returned.
         """
+        points = self._process_points(point)
         if self.threads and executor is not None:
             fs = []
-            [fs.extend(future) for future in [
-                container.func_threads('signal', executor=executor,
-                                       point=self.market.process_point(point, freq),
-                                       candles=self.candles(freq)
-                                       ) for freq, container in self._indicators.items()]]
-            signals = pd.Series([future.result() for future in concurrent.futures.wait(fs)[0]])
+            for freq, container in self._indicators.items():
+                fs.extend(container.func_threads('signal', executor=executor,
+                                                 point=points[freq], candles=self.candles(freq)))
+            signals = [future.result() for future in fs]
         else:
-            values = [container.signal(self.market.process_point(point, freq),
-                                       ) for freq, container in self._indicators.items()]
-            signals = pd.Series(values)
+            signals = [container.signal(points[freq]) for freq, container in self._indicators.items()]
 
-            if signals.hasnans:
+            if any(isnan(i) for i in signals):
                 raise RuntimeError(f"Computed indicator data for `TrendDetector` does not exist for {point}")
 
         if raw:
-            return signals
+            return pd.Series(signals)
 
-        return TrendDirection(signals.mode()[0])
+        # most common value. Ties are resolved to the lowest value, as is done by `pd.Series.mode()`
+        counts = np.bincount(np.asarray(signals, dtype=int) - TrendDirection.DOWN, minlength=len(TrendDirection))
+        return TrendDirection(int(counts.argmax()) + TrendDirection.DOWN)
 
     def _determine_scalar(self, trend: TrendDirection, point: Optional[pd.Timestamp],
                           executor: concurrent.futures.Executor = None) -> float:
@@ -140,39 +271,49 @@ class TrendDetector(object):
         if signal == Signal.HOLD:
             return nan
 
-        # `results` holds return values of strength
+        points = self._process_points(point)
         if self.threads and executor is not None:
-            fs = []
-            [fs.extend(future) for future in [
-                container.func_threads('strength', executor=executor,
-                                       point=self.market.process_point(point, freq),
-                                       candles=self.candles(freq),
-                                       ) for freq, container in self._indicators.items()]]
-            results = pd.Series([future.result() for future in concurrent.futures.wait(fs)[0]])
+            # submit all tasks at once so that there is a single synchronization point
+            signal_fs = []
+            strength_fs = []
+            for freq, container in self._indicators.items():
+                _point = points[freq]
+                _candles = self.candles(freq)
+                signal_fs.extend(container.func_threads('signal', executor=executor,
+                                                        point=_point, candles=_candles))
+                strength_fs.extend(container.func_threads('strength', executor=executor,
+                                                          point=_point, candles=_candles))
+
+            # results must remain in submission order so that `strengths` can be masked by `signals`
+            signals = pd.Series([future.result() for future in signal_fs])
+            strengths = pd.Series([future.result() for future in strength_fs])
         else:
-            signals = []
-            strengths = []
+            # read directly from each indicator instead of building `container.computed` for every frequency
+            _len = sum(len(container.indicators) for container in self._indicators.values())
+            signals = np.empty(_len)
+            strengths = np.empty(_len)
+            i = 0
             for freq, container in self._indicators.items():
-                _point = self.market.process_point(point, freq)
-                _row = container.computed.loc[_point]
-
-                # hack to convert df to series returned when indexing w/ str instead of timestamp when '1D'
-                if type(_row) is pd.DataFrame:
-                    _row = _row.iloc[0]
-                _strengths = _row.xs('strength', axis='index', level=1)
-                _signals = _row.xs('signal', axis='index', level=1)
-                signals.append(_signals)
-                strengths.append(_strengths)
-
-            signals = pd.concat(signals, axis='index', ignore_index=True)
-            strengths = pd.concat(strengths, axis='index', ignore_index=True)
-            assert signals.shape == strengths.shape
-
-            # TODO: implement scalar weight where longer frequencies more heavily influence scalar value
-            _mean = strengths[signals == signal].dropna().mean()
-            if _mean < 1:
-                return 1
-            return _mean
+                _point = points[freq]
+                for indicator in container.indicators:
+                    _row = indicator.computed.loc[_point]
+
+                    # hack to convert df to series returned when indexing w/ str instead of timestamp when '1D'
+                    if type(_row) is pd.DataFrame:
+                        _row = _row.iloc[0]
+                    signals[i] = _row['signal']
+                    strengths[i] = _row['strength']
+                    i += 1
+
+            signals = pd.Series(signals)
+            strengths = pd.Series(strengths)
+        assert signals.shape == strengths.shape
+
+        # TODO: implement scalar weight where longer frequencies more heavily influence scalar value
+        _mean = strengths[signals == signal].dropna().mean()
+        if _mean < 1:
+            return 1
+        return _mean
 
     def characterize(self, point: Optional[pd.Timestamp] = None) -> MarketTrend:
         """ Characterize trend magnitude (direction and strength of trend).
@@ -190,25 +331,29 @@ class TrendDetector(object):
                 `unison == False`, or where consensus of `self.indicators.check()` is used when `unison == True`
             -   introduce `strength` binary flag to return values based on most extreme scalar (`abs` of `strength()`)
         """
+        latest = None
         if not point:
-            point = self.market.most_recent_timestamp
+            point = latest = self.market.most_recent_timestamp
+
+            # market trend only changes when new candle data arrives
+            if self._characterize_cache[0] is not None and self._characterize_cache[0] == latest:
+                return self._characterize_cache[1]
 
-        # remove `freq` value to prevent `KeyError`
-        if hasattr(point, 'timestamp'):
-            point = pd.Timestamp.fromtimestamp(point.timestamp(), tz=TZ)
+        # convert to global timezone without a round-trip through a POSIX timestamp
+        if isinstance(point, datetime):
+            point = pd.Timestamp(point)
+            point = point.tz_convert(TZ) if point.tzinfo else point.tz_localize(TZ)
 
         # temporarily disable multithreading to fix masking of `strength` on a high level
         if self.threads and False:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads * len(self._frequencies)) as executor:
-                _trend = executor.submit(self._fetch_trend, point, executor)
-                concurrent.futures.wait([_trend])
-                trend = _trend.result()
-
-                _strengths = executor.submit(self._determine_scalar, trend, point, executor)
-                concurrent.futures.wait([_strengths])
-                scalar = _strengths.result()
+            # tasks are fanned-out by each method, so neither method is submitted to `executor` itself
+            trend = self._fetch_trend(point, self._executor)
+            scalar = self._determine_scalar(trend, point, self._executor)
         else:
             trend = self._fetch_trend(point)
             scalar = self._determine_scalar(trend, point)
 
-        return MarketTrend(trend, scalar=scalar)
+        result = MarketTrend(trend, scalar=scalar)
+        if latest is not None:
+            self._characterize_cache = (latest, result)
+        return result
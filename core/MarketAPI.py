@@ -1,13 +1,22 @@
 from abc import ABC, abstractmethod
+import concurrent.futures
 import datetime
+from functools import lru_cache
 import logging
 from os import path
+import threading
+import time
 from warnings import warn
+import weakref
 
+import numpy as np
 import pandas as pd
+from pandas.tseries.frequencies import to_offset
 from pytz import timezone
-from typing import Dict, List, NoReturn, Union, Optional, Tuple
-from yaml import safe_dump, safe_load
+import requests
+from requests.adapters import HTTPAdapter
+from typing import ClassVar, Dict, List, NoReturn, Union, Optional, Sequence, Tuple
+import yaml
 import warnings
 
 from core.market import Market
@@ -16,15 +25,30 @@ from models.trades import Trade, SuccessfulTrade, FailedTrade
 from primitives import CachedValue
 
 
+_SQL_CHUNKSIZE = 1000
+""" Number of rows per `INSERT` statement when saving candle data to the database. """
+
+_MAX_AGE_TTL = 30
+""" Maximum number of seconds that `candles()` skips checking the age of candle data. """
+
+# libyaml bindings are used when available, since `restore()` parses files for every platform on start-up
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+_FETCH_ALL_WORKERS = 4
+""" Number of symbols that `fetch_all()` updates concurrently. Each symbol fetches its frequencies concurrently. """
+
+
 class MarketAPI(Market, ABC):
     """ Intermediate class which abstracts a Market API.
 
     Posts sell and buy orders, records historical candle data.
 
     For specific platforms, functions need to be defined to post and process orders, and request other data.
-    However, all derived class instances are stored in the class var `instances`, and can be accessed by instance
-    `key`. During program start-up and shutdown, `snapshot()`/`restore()` functionality saves and restores all
-    running instances.
+    However, all live derived class instances are tracked by the class var `instances`, and can be accessed by
+    instance `id`. `instances` only holds weak references, so instances must be referenced elsewhere to be tracked.
+    During program start-up and shutdown, `snapshot()`/`restore()` functionality saves and restores all running
+    instances. Restored instances are referenced by `_restored`.
 
     Fields:
         __name__ (str):
@@ -45,7 +69,20 @@ class MarketAPI(Market, ABC):
     _INSTANCES_FN: str
     _SECRET_FN: str
 
-    instances: Dict[str, 'MarketAPI'] = {}
+    instances: 'weakref.WeakValueDictionary[str, MarketAPI]' = weakref.WeakValueDictionary()
+    """ Live instances mapped by `id`. Instances which are no longer referenced are dropped along with their data. """
+
+    _restored: Dict[str, 'MarketAPI'] = {}
+    """ Instances created by `restore()` mapped by `id`. Held here since nothing else references them.
+
+    Restoring an instance again replaces the previous instance, so that it can be released.
+    """
+
+    _http: ClassVar[Optional[requests.Session]] = None
+    """ HTTP session shared by all instances of a platform. Accessed via `_session()`. """
+
+    _frames: Dict[str, pd.DataFrame]
+    """ Candle data mapped by frequency. Populated via `_data`. """
 
     def __init__(self, api_key: str = None, api_secret: str = None,
                  update: bool = True, load: bool = True, ignore_exclude: bool = False, auto_update: bool = True,
@@ -83,6 +120,21 @@ class MarketAPI(Market, ABC):
 
         self.auto_update = auto_update
 
+        self._periods: Dict[str, str] = {}
+        """ Cache of `translate_period()` results. Populated by `_period()`. """
+
+        self._timedeltas: Dict[str, pd.Timedelta] = {}
+        """ Cache of parsed frequency strings. Populated by `_timedelta()`. """
+
+        self._checked: Dict[str, float] = {}
+        """ Monotonic time until which candle data for each frequency does not need to be checked by `candles()`. """
+
+        self._lock = threading.RLock()
+        """ Held while candle data is updated, so that concurrent callers of `candles()` do not fetch it twice. """
+
+        self._unsaved: set = set()
+        """ Frequencies updated by `candles()` or `update()` which have not been saved to the database since. """
+
         if ignore_exclude:
             self.load(ignore_exclude=True)
             self.update(load=False, save=False)
@@ -94,8 +146,26 @@ class MarketAPI(Market, ABC):
 
         self.instances[self.id] = self
 
-        # Setup special values
-        self._fee = CachedValue(self._get_fee, default=fee)
+        # Setup special values. Fee is fetched on first access, so that instances which never trade do not request it.
+        self._fee = CachedValue(self._get_fee, default=fee, lazy=True)
+
+    @classmethod
+    def _session(cls) -> requests.Session:
+        """ Get HTTP session for platform, creating it on first use.
+
+        Notes:
+            Reusing a session keeps connections alive between requests, which avoids a TCP and TLS handshake for every
+            request. The connection pool is large enough for every frequency of every symbol updated by `fetch_all()`
+            to use its own connection.
+            All platform requests should be issued via this session.
+        """
+        session = cls.__dict__.get('_http')
+        if session is None:
+            session = requests.Session()
+            pool_size = max(10, _FETCH_ALL_WORKERS * len(getattr(cls, 'valid_freqs', ())))
+            session.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
+            cls._http = session
+        return session
 
     @property
     def fee(self):
@@ -105,21 +175,83 @@ class MarketAPI(Market, ABC):
     def _stale_candles(self) -> Tuple[str]:
         """ Check all candles for stale data
 
+        Notes:
+            Equivalent to calling `_check_candle_age()` for every frequency. Last timestamps and frequency intervals are
+            gathered as nanoseconds, then compared with a single array operation, which avoids creating a `Timestamp`
+            and `Timedelta` for every frequency.
+
         Returns
             A list of frequencies that need to be updated.
         """
-        now = datetime.datetime.now(tz=timezone(self._global_tz))
-        stale = []
-        for freq in self.valid_freqs:
-            _stale = self._check_candle_age(freq, now)
-            if _stale:
-                stale.append(freq)
+        freqs = self.valid_freqs
+        now = pd.Timestamp.now(tz='UTC').value
+
+        # missing or empty candle data is always stale
+        missing = np.zeros(len(freqs), dtype=bool)
+        lasts = np.full(len(freqs), now, dtype='i8')
+        for i, freq in enumerate(freqs):
+            frame = self._frames.get(freq)
+            if frame is None or frame.empty:
+                missing[i] = True
+            else:
+                lasts[i] = frame.index.asi8[-1]
+        intervals = np.fromiter((self._timedelta(freq).value for freq in freqs), dtype='i8', count=len(freqs))
+
+        stale = missing | (now - lasts > intervals)
+        return tuple(freq for freq, _stale in zip(freqs, stale) if _stale)
 
-        return tuple(stale)
+    @property
+    def most_recent_timestamp(self) -> pd.Timestamp:
+        """ Most recent timestamp of candle data across all frequencies.
+
+        Notes:
+            Only the last index of each frame is read. `_data` is not accessed since that would concatenate candle data
+            for all frequencies, and the last row of `_data` is not necessarily the most recent.
+        """
+        return max(frame.index[-1] for frame in self._frames.values() if len(frame))
+
+    @property
+    def _data(self) -> pd.DataFrame:
+        """ Candle data for all frequencies as a single `DataFrame`.
+
+        Notes:
+            Candle data is stored per frequency in `_frames` since all access to candle data is done by frequency.
+            This avoids slicing a `MultiIndex` on every call to `candles()`. Frequencies are only concatenated when
+            candle data for all frequencies is needed at once (ie: when combining or storing candle data).
+
+        Returns:
+            `DataFrame` with a `MultiIndex` where the first level is frequency and the second is time.
+        """
+        if not self._frames:
+            return pd.DataFrame(columns=list(self.columns))
+        return pd.concat(self._frames.values(), keys=self._frames.keys())
+
+    @_data.setter
+    def _data(self, data: pd.DataFrame) -> NoReturn:
+        self._frames = self._split_frequencies(data)
+
+    @staticmethod
+    def _split_frequencies(data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """ Split `MultiIndex`-ed candle data into a mapping of frequency to candle data. """
+        if not isinstance(data.index, pd.MultiIndex):
+            assert data.empty
+            return {}
+        return {freq: data.loc[freq] for freq in data.index.get_level_values(0).unique()}
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _timezone(name: str) -> timezone:
+        """ Memoized `pytz.timezone()`.
+
+        Notes:
+            `timezone()` normalizes and looks up `name` on every call. Timezone names are few and static, so lookups
+            are shared across all instances.
+        """
+        return timezone(name)
 
     @property
     def tz(self) -> timezone:
-        return timezone(self._tzname)
+        return self._timezone(self._tzname)
 
     @tz.setter
     def tz(self, val: timezone) -> NoReturn:
@@ -141,15 +273,15 @@ class MarketAPI(Market, ABC):
         Returns
             True if candle data is empty or is stale and therefore needs to be updated. Otherwise, returns False.
         """
-        if self._data.empty:
+        if frequency not in self._frames or self._frames[frequency].empty:
             return True
         if now is None:
-            now = datetime.datetime.now(tz=timezone(self._global_tz))
-        data = self._data.loc[frequency]
-        last_point = data.iloc[-1].name
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+        # read the last timestamp directly from the index instead of constructing the last row via `iloc`
+        last_point = self._frames[frequency].index[-1]
         delta: pd.Timedelta = now - last_point
 
-        return delta > pd.Timedelta(frequency)
+        return delta > self._timedelta(frequency)
 
     @abstractmethod
     def _fetch_candles(self, freq: Optional[str] = None) -> pd.DataFrame:
@@ -162,27 +294,48 @@ class MarketAPI(Market, ABC):
         pass
 
     def _update_frequency(self, frequency: str) -> NoReturn:
-        assert frequency in self.valid_freqs
-        assert frequency in self._data.index.levels[0]
+        self._update_frequencies((frequency,))
 
-        self._data.loc[frequency] = self.fetch_candles(frequency)
+    def _update_frequencies(self, frequencies: Sequence[str]) -> NoReturn:
+        """ Update candle data for several frequencies, fetching all frequencies concurrently.
+
+        Fetched candle data is merged via `_combine_frequency()` so that only new rows are appended and older
+        candle data is retained.
+        """
+        for frequency in frequencies:
+            assert frequency in self._frames
+
+        with self._lock:
+            for frequency, candles in self._fetch_frequencies(frequencies).items():
+                self._frames[frequency] = self._combine_frequency(self._frames[frequency], candles)
+                self._unsaved.add(frequency)
 
     def candles(self, freq: str) -> pd.DataFrame:
         """ Retrieve specified candle data.
 
-        `_data` contains candle data for all frequencies, but index contains keys which correspond to
-        different frequencies. This function checks that `freq` is valid.
+        Candle data for each frequency is stored separately in `_frames`. This function checks that `freq` is valid,
+        which is a constant-time lookup since `_frames` is keyed by `valid_freqs`.
 
         Also, when `auto_update` is True, this function checks that data is still valid by calling
-        `_check_candle_age()` which returns True if candle data is stale.
+        `_check_candle_age()` which returns True if candle data is stale. Since frequencies tend to expire together,
+        all other stale frequencies are fetched concurrently as well instead of one-by-one on later calls.
         """
-        assert freq in self.valid_freqs
-        assert freq in self._data.index.levels[0]
-
-        if self.auto_update and self._check_candle_age(freq):
-            self._update_frequency(freq)
-
-        return self._data.loc[freq]
+        assert freq in self._frames
+
+        if self.auto_update:
+            # staleness can only change on the scale of `freq`, so the check is skipped for a fraction of the interval
+            if time.monotonic() >= self._checked.get(freq, 0):
+                with self._lock:
+                    # candle data might have been updated by another thread while waiting
+                    now = time.monotonic()
+                    if now >= self._checked.get(freq, 0):
+                        if self._check_candle_age(freq):
+                            stale = [i for i in self._stale_candles if i != freq and i in self._frames]
+                            self._update_frequencies([freq, *stale])
+                        self._checked[freq] = now + min(self._timedelta(freq).total_seconds() / 10, _MAX_AGE_TTL)
+
+        # frames are replaced rather than modified, so readers never observe a partially updated frame
+        return self._frames[freq]
 
     @classmethod
     def restore(cls, fn: str = None, **kwargs) -> NoReturn:
@@ -200,28 +353,34 @@ class MarketAPI(Market, ABC):
             fn = cls._INSTANCES_FN
 
         with open(path.join(cls.root, cls._SECRET_FN), 'r') as f:
-            secrets = safe_load(f)
+            secrets = yaml.load(f, Loader=_SafeLoader)
 
         with open(path.join(cls.root, fn), 'r') as f:
-            params = safe_load(f)
+            params = yaml.load(f, Loader=_SafeLoader)
 
         for i in params:
             instance = cls(secrets['key'], secrets['secret'], **i, update=False, **kwargs)
             instance.load()
             cls.instances[instance.id] = instance
+            cls._restored[instance.id] = instance
 
     @classmethod
     def snapshot(cls, fn: str = None) -> NoReturn:
         if fn is None:
             fn = cls._INSTANCES_FN
 
-        lines: List[Dict] = []
-        for i in cls.instances.values():
-            lines.append({'symbol': i.symbol})
-            i.save()
+        instances = list(cls.instances.values())
+        lines: List[Dict] = [{'symbol': i.symbol} for i in instances]
+
+        # saving writes to disk and the database, so instances are saved in separate threads to overlap waiting
+        if instances:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(_FETCH_ALL_WORKERS, len(instances))) as executor:
+                fs = [executor.submit(i.save) for i in instances]
+                for future in fs:
+                    future.result()
 
         with open(path.join(cls.root, fn), 'w') as f:
-            safe_dump(lines, f)
+            yaml.dump(lines, f, Dumper=_SafeDumper)
 
     def update(self, load: bool = True, save: bool = True) -> None:
         """ Updates `data` with recent candle data.
@@ -242,20 +401,22 @@ class MarketAPI(Market, ABC):
         # self._check_tz()
 
         try:
-            _data = []
-            for freq in self.valid_freqs:
-                if self._check_candle_age(freq):
-                    _candles = self.fetch_candles(freq)
-                else:
-                    print(f"Using cached candle data for {freq}")
-                    _candles = self._data.loc[freq]
-                _data.append(_candles)
-
-            data = pd.concat(_data, axis='index', keys=self.valid_freqs)    # add keys
-            self._data = self._combine_candles(data)
-
+            with self._lock:
+                fetched = self._fetch_frequencies(self._stale_candles)
+
+                # only frequencies with new data are combined. Cached candle data is left untouched.
+                for freq in self.valid_freqs:
+                    if freq in fetched:
+                        self._frames[freq] = self._combine_frequency(self._frames.get(freq), fetched[freq])
+                        self._unsaved.add(freq)
+                    else:
+                        print(f"Using cached candle data for {freq}")
+
+            # only frequencies with new candle data are written, and nothing is written when candle data is unchanged
             if save:
-                self.save()
+                changed = [freq for freq in self.valid_freqs if freq in self._unsaved]
+                if changed:
+                    self.save(frequencies=changed)
             print(f"Update complete for {self.__name__}")
         except ConnectionError as e:
             msg = f'Connection Error. Deferring to cached data.'
@@ -284,47 +445,229 @@ class MarketAPI(Market, ABC):
         pass
 
     def _combine_candles(self, incoming: pd.DataFrame) -> pd.DataFrame:
-        if not self._data.index.empty:
-            assert self._data.index.get_level_values(1).tz == incoming.index.get_level_values(1).tz
-        combined = pd.concat([self._data, incoming])
-        combined = combined[~combined.index.duplicated(keep="first")]         # drop rows w/ duplicated index
+        """ Combine `MultiIndex`-ed candle data with existing candle data.
 
-        _sorted = combined.sort_index()
-        del combined
-        _sorted.index = pd.MultiIndex.from_tuples(_sorted.index)
-        return _sorted
+        Args:
+            incoming:
+                Candle data for any number of frequencies. Must share the same timezone as existing candle data.
+
+        Returns:
+            Combined candle data for all frequencies, sorted by frequency then time.
+        """
+        incoming = self._split_frequencies(incoming)
+        frames = dict(self._frames)
+        for freq, candles in incoming.items():
+            frames[freq] = self._combine_frequency(frames.get(freq), candles)
+
+        if not frames:
+            return self._data
+
+        keys = sorted(frames.keys())
+        return pd.concat([frames[freq] for freq in keys], keys=keys)
+
+    @staticmethod
+    def _combine_frequency(existing: Optional[pd.DataFrame], incoming: pd.DataFrame) -> pd.DataFrame:
+        """ Combine candle data for a single frequency.
+
+        Notes:
+            Since candle data is stored per frequency, only the candle data of the frequency being updated is
+            copied, instead of the candle data of all frequencies.
+
+        Args:
+            existing:
+                Stored candle data. Rows take precedence over rows in `incoming` with the same timestamp.
+            incoming:
+                Newly fetched candle data.
+
+        Returns:
+            Sorted candle data without duplicated timestamps.
+        """
+        if not incoming.index.is_unique:
+            incoming = incoming[~incoming.index.duplicated(keep="first")]
+
+        # emptiness is determined by rows, since `DataFrame.empty` is also True for frames with rows but no columns
+        if existing is None or len(existing.index) == 0:
+            combined = incoming
+        else:
+            assert existing.index.tz == incoming.index.tz
+
+            # incoming candle data usually only overlaps the tail of existing data. When every overlapping row
+            # already exists, only rows past the cutoff need to be appended and no hashing or sorting is required.
+            index = existing.index
+            if index.is_monotonic_increasing and index.is_unique:
+                cutoff = index[-1]
+                if len(incoming) and incoming.index.is_monotonic_increasing and incoming.index[0] > cutoff:
+                    # strictly newer candle data is appended as-is
+                    return pd.concat([existing, incoming])
+
+                overlap = incoming.index[incoming.index <= cutoff]
+                if (index.get_indexer(overlap) != -1).all():
+                    tail = incoming[incoming.index > cutoff]
+                    if len(tail.index) == 0:
+                        return existing
+                    if tail.index.is_monotonic_increasing and tail.index.is_unique:
+                        return pd.concat([existing, tail])
+
+            if not index.is_unique:
+                existing = existing[~index.duplicated(keep="first")]
+
+            # only incoming rows are filtered, instead of hashing the index of both frames combined
+            combined = pd.concat([existing, incoming[~incoming.index.isin(existing.index)]])
+
+        return combined.sort_index()
+
+    def _period(self, freq: str) -> str:
+        """ Translate `freq` via `translate_period()`, translating each frequency only once.
+
+        Notes:
+            Translated periods are static for a given market, however `process_point()` and `_repair_candles()` are
+            called for every point and every fetch, respectively.
+        """
+        period = self._periods.get(freq)
+        if period is None:
+            period = self._periods[freq] = self.translate_period(freq)
+        return period
+
+    def _timedelta(self, freq: str) -> pd.Timedelta:
+        """ Parse `freq` as a `Timedelta`, parsing each frequency only once.
+
+        Notes:
+            `_check_candle_age()` is called by every call to `candles()` when `auto_update` is set.
+        """
+        delta = self._timedeltas.get(freq)
+        if delta is None:
+            try:
+                delta = pd.Timedelta(freq)
+            except ValueError:
+                # bare aliases such as 'D' are only understood as offsets. Market intervals such as '1m' are parsed
+                # by `Timedelta` first since `to_offset()` interprets 'm' as month.
+                delta = pd.Timedelta(to_offset(freq).nanos)
+            self._timedeltas[freq] = delta
+        return delta
 
     def _repair_candles(self, data: pd.DataFrame, freq: str) -> pd.DataFrame:
         """ Fill in missing values for candle data via interpolation. """
         assert freq in self.valid_freqs
 
-        buffer = data.copy(deep=True)
+        _freq = self._period(freq)
+
+        # `to_offset()` also accepts bare aliases such as 'D' or 'H', which `Timedelta` rejects
+        step = to_offset(_freq).nanos
+        numeric = all(pd.api.types.is_numeric_dtype(i) for i in data.dtypes)
+
+        if len(data) > 1 and data.index.is_monotonic_increasing:
+            # candle data usually has no gaps or missing values, in which case there is nothing to repair
+            if (np.diff(data.index.asi8) == step).all() and not data.isna().values.any():
+                return data
+
+            # when all timestamps lie on a fixed interval from the first, grid positions are computed arithmetically,
+            # which replaces hashing the index for `duplicated()` and `reindex()`
+            offsets = data.index.asi8 - data.index.asi8[0]
+            if numeric and not (offsets % step).any():
+                positions = offsets // step
+                _, first = np.unique(positions, return_index=True)     # first row of each duplicated timestamp
+                # column-major so that each column of the resulting frame is contiguous, as required by TA-lib
+                values = np.full((positions[-1] + 1, data.shape[1]), np.nan, order='F')
+                values[positions[first]] = data.to_numpy(dtype=float)[first]
+                self._interpolate(values)
+
+                index = pd.date_range(start=data.index[0], periods=len(values), freq=_freq, tz=data.index.tz)
+                return pd.DataFrame(values, index=index, columns=data.columns)
 
         start = data.index[0]
         end = data.index[-1]
-        _freq = self.translate_period(freq)
 
         # drop invalid rows
         # drop duplicated rows w/ 0 in columns
         # data.drop(data.loc[data['volume'] == 0], inplace=True)        # drop rows w/ 0 volume
-        buffer = buffer[~buffer.index.duplicated(keep="first")]         # drop rows w/ duplicated index
+        buffer = data
+        if not data.index.is_unique:
+            buffer = data[~data.index.duplicated(keep="first")]         # drop rows w/ duplicated index
 
         index = pd.date_range(start=start, end=end, freq=_freq, tz=data.index.tz)
         buffer = buffer.reindex(index)
-        buffer.interpolate(inplace=True)
+
+        if numeric:
+            # `reindex()` already returns a new frame, so values are filled in-place without another copy
+            values = np.asfortranarray(buffer.to_numpy(dtype=float))
+            self._interpolate(values)
+            buffer = pd.DataFrame(values, index=buffer.index, columns=buffer.columns)
+        else:
+            buffer.interpolate(inplace=True)
 
         assert buffer.index.is_monotonic_increasing
 
         return buffer
 
-    def fetch_candles(self, freq: Optional[str] = None) -> pd.DataFrame:
-        """ Fetch and clean candle data """
+    @staticmethod
+    def _interpolate(values: np.ndarray) -> NoReturn:
+        """ Linearly interpolate missing values of each column in-place.
+
+        Notes:
+            Equivalent to `DataFrame.interpolate()` with default arguments: rows are treated as equally spaced, leading
+            missing values are left untouched, and trailing missing values are filled with the last valid value.
+
+        Args:
+            values:
+                2-dimensional array of candle data where each column is a field.
+        """
+        x = np.arange(values.shape[0])
+        for column in values.T:
+            valid = ~np.isnan(column)
+            if valid.all() or not valid.any():
+                continue
+            missing = ~valid
+            missing[:valid.argmax()] = False                            # leave leading values
+            column[missing] = np.interp(x[missing], x[valid], column[valid])
+
+    def fetch_candles(self, freq: Optional[str] = None, since: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """ Fetch and clean candle data
+
+        Args:
+            freq:
+                Frequency to fetch candle data for.
+            since:
+                Last stored timestamp. When given, earlier rows are dropped before repairing, since they are already
+                stored. The row at `since` is kept so that a gap directly after existing candle data is interpolated.
+        """
         print(f"Fetching candle data for {freq}...")
         data = self._fetch_candles(freq)
+        if since is not None:
+            data = data[data.index >= since]
+            if data.empty:
+                return data
         data = self._repair_candles(data, freq)
 
         return data
 
+    def _fetch_frequencies(self, frequencies: Sequence[str]) -> Dict[str, pd.DataFrame]:
+        """ Fetch and clean candle data for several frequencies concurrently.
+
+        Notes:
+            Fetching candle data is I/O-bound, therefore each frequency is requested in a separate thread so that the
+            time spent waiting on the network overlaps.
+
+        Args:
+            frequencies:
+                Frequencies to fetch candle data for.
+
+        Returns:
+            Mapping of frequency to cleaned candle data.
+        """
+        if not frequencies:
+            return {}
+
+        # only candle data after what is already stored needs to be repaired
+        since = {}
+        for freq in frequencies:
+            frame = self._frames.get(freq)
+            if frame is not None and not frame.empty and frame.index.is_monotonic_increasing:
+                since[freq] = frame.index[-1]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(frequencies)) as executor:
+            fs = {freq: executor.submit(self.fetch_candles, freq, since.get(freq)) for freq in frequencies}
+            return {freq: future.result() for freq, future in fs.items()}
+
     @abstractmethod
     def process_point(self, point: pd.Timestamp, freq: str) -> Union['pd.Timestamp', str]:
         """ Quantize and shift timestamp `point` for parsing market specific data.
@@ -355,28 +698,44 @@ class MarketAPI(Market, ABC):
         if tz is None:
             tz = self.tz
 
-        candles = []
-        _data = self._data.copy(True)
-        for freq in self.valid_freqs:
-            _candles = _data.loc[freq]
-            _dti = pd.to_datetime(_candles.index, utc=True).tz_convert(tz)
-            _candles.index = _dti
-            candles.append(_candles)
+        # convert each frequency separately instead of rebuilding a `MultiIndex`
+        frames = {}
+        for freq, _candles in self._frames.items():
+            index = _candles.index
+            if not isinstance(index, pd.DatetimeIndex):
+                index = pd.to_datetime(index, utc=True)
+            elif index.tz is None:
+                index = index.tz_localize('UTC')
 
-        self._data = pd.concat(candles, keys=self.valid_freqs)
+            # shallow copy shares values with the original. Only the index is replaced.
+            _candles = _candles.copy(deep=False)
+            _candles.index = index.tz_convert(tz)
+            frames[freq] = _candles
+
+        self._frames = frames
 
     def load(self, ignore_exclude: bool = False):
         self.load_from_db()     # call first to prevent `_data` from being overwritten
 
         super().load(ignore_exclude)
 
+        # candle data is stored in `_frames` instead of as a `DataFrame` attribute, so it is not loaded by `super()`
+        if ignore_exclude:
+            _data = self._load_frame('_data')
+            if _data is not None:
+                self._data = _data
+
         # fix `DateTimeIndex`
         self._set_index_tz()
 
-    def save(self, ignore_exclude: bool = False):
+    def save(self, ignore_exclude: bool = False, frequencies: Sequence[str] = None):
         super().save(ignore_exclude)
 
-        self.save_to_db()
+        # candle data is stored in `_frames` instead of as a `DataFrame` attribute, so it is not saved by `super()`
+        if ignore_exclude:
+            self._save_frame('_data', self._data)
+
+        self.save_to_db(frequencies)
 
     @classmethod
     @property
@@ -401,7 +760,7 @@ class MarketAPI(Market, ABC):
             Maybe a discreet `CandleData` class could lower boilerplate code in the future.
         """
         _tzname = self._global_tz
-        _tz = timezone(_tzname)
+        _tz = self._timezone(_tzname)
         print(f"Checking tz. Detected global tz to be {_tzname}.")
         if self.tz != _tz:
             print(f"Instance tz ({self.tz}) differs from global tz...")
@@ -413,33 +772,71 @@ class MarketAPI(Market, ABC):
 
     @classmethod
     def fetch_all(cls, api_secret: str, api_key: str, assets: List[str] = None):
+        """ Update candle data for several symbols concurrently.
+
+        Notes:
+            Updating is I/O-bound, therefore symbols are updated in separate threads. The number of threads is limited
+            by `_FETCH_ALL_WORKERS` since every symbol also fetches all of its frequencies concurrently.
+        """
         if assets is None:
             assets = cls.asset_pairs
-        for symbol in assets:
+
+        def _update(symbol: str) -> 'MarketAPI':
             print(f"Starting to update candle data for {symbol}")
-            cls(api_secret=api_secret, api_key=api_key, symbol=symbol)
+            return cls(api_secret=api_secret, api_key=api_key, symbol=symbol)
+
+        workers = max(1, min(_FETCH_ALL_WORKERS, len(assets)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            fs = [executor.submit(_update, symbol) for symbol in assets]
+            for future in fs:
+                future.result()
+
+    def save_to_db(self, frequencies: Sequence[str] = None):
+        """ Write candle data to database.
+
+        Args:
+            frequencies:
+                Frequencies to write. By default, all frequencies are written. Frequencies without candle data are
+                skipped.
+        """
+        if frequencies is None:
+            frequencies = self.valid_freqs
 
-    def save_to_db(self):
         print(f"Saving to db")
         _prefix = f"{self.__name__}_{self.symbol}"
-        for freq in self.valid_freqs:
-            table = f"{_prefix}_{freq}"
-            self.candles(freq).to_sql(table, ENGINE, if_exists='replace', index=True)
+
+        # frames are read before the transaction is opened, since `candles()` may fetch candle data. Frames are
+        # replaced rather than modified, so the frames being written cannot change once read.
+        with self._lock:
+            frames = {freq: self._frames[freq] for freq in frequencies if freq in self._frames}
+
+        # write all frequencies in a single transaction using multi-row inserts
+        with ENGINE.begin() as conn:
+            for freq, candles in frames.items():
+                table = f"{_prefix}_{freq}"
+                candles.to_sql(table, conn, if_exists='replace', index=True,
+                               method='multi', chunksize=_SQL_CHUNKSIZE)
+
+        # frequencies updated while writing remain unsaved
+        with self._lock:
+            for freq, candles in frames.items():
+                if self._frames.get(freq) is candles:
+                    self._unsaved.discard(freq)
         print("Done saving to db")
 
     def load_from_db(self):
         print("Loading from db")
         try:
             _prefix = f"{self.__name__}_{self.symbol}"
-            data = []
-            for freq in self.valid_freqs:
-                table = f"{_prefix}_{freq}"
-                _data = pd.read_sql_table(table, ENGINE)
-                _data.index = pd.DatetimeIndex(_data['index'])
-                del _data['index']
-                data.append(_data)
-
-            self._data = pd.concat(data, keys=self.valid_freqs)
+            frames = {}
+            with ENGINE.connect() as conn:
+                for freq in self.valid_freqs:
+                    table = f"{_prefix}_{freq}"
+                    # parse index while reading so that it does not need to be rebuilt afterwards
+                    frames[freq] = pd.read_sql_table(table, conn, index_col='index',
+                                                     parse_dates={'index': {'utc': True}})
+
+            self._frames = frames
 
             print("Done loading from db")
 
@@ -52,7 +52,7 @@ class Market(StoredObject, ABC):
 
     @property
     def most_recent_timestamp(self) -> pd.Timestamp:
-        return self._data.iloc[-1].name
+        return self._data.index[-1]
 
     @abstractmethod
     def candles(self, freq: str) -> pd.DataFrame:
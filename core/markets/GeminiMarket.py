@@ -3,11 +3,9 @@ from datetime import timedelta
 import hashlib
 import hmac
 import json
-from pytz import timezone
 import time
 from typing import Union, Optional
 import pandas as pd
-import requests
 import logging
 
 from core.MarketAPI import MarketAPI
@@ -15,6 +13,21 @@ from primitives import ReasonCode
 from models import json_to_df, Trade, SuccessfulTrade, FailedTrade
 
 
+_FLOOR_NS = {
+    '1m': 60 * 10 ** 9,
+    '5m': 5 * 60 * 10 ** 9,
+    '15m': 15 * 60 * 10 ** 9,
+    '30m': 30 * 60 * 10 ** 9,
+    '1hr': 60 * 60 * 10 ** 9,
+}
+""" Length of candle intervals in nanoseconds. Used to quickly quantize timestamps in `process_point()`.
+
+Notes:
+    '6hr' and '1day' are excluded since they are quantized in local time, which is not always a multiple of the
+    interval from the epoch.
+"""
+
+
 class GeminiMarket(MarketAPI):
     """ Primary interface for interacting with the Gemini market/exchange.
 
@@ -57,6 +70,9 @@ class GeminiMarket(MarketAPI):
     _SECRET_FN = "gemini_api.yml"
     _INSTANCES_FN = "gemini_instances.yml"
 
+    _ORDER_TEMPLATE = {'type': "exchange limit", 'options': ("fill-or-kill",)}
+    """ Constant parameters of every order placed by `post_order()`. """
+
     def _get_fee(self) -> float:
         """ Retrieve current transaction fee.
 
@@ -122,7 +138,7 @@ class GeminiMarket(MarketAPI):
         """
         assert freq in self.valid_freqs
 
-        response = requests.get(self.BASE_URL + f"/v2/candles/{self.symbol}/{freq}")
+        response = self._session().get(self.BASE_URL + f"/v2/candles/{self.symbol}/{freq}")
         raw_candle_data = response.json()
         if type(raw_candle_data) is dict\
                 and 'result' in raw_candle_data.keys()\
@@ -138,7 +154,7 @@ class GeminiMarket(MarketAPI):
         # set flag/metadata on `DataFrame`
         # TODO: use pandas' built-in `freq` value for index
         data.attrs['freq'] = freq
-        data.index = data.index.tz_localize(timezone(self._global_tz), ambiguous='infer')
+        data.index = data.index.tz_localize(self._timezone(self._global_tz), ambiguous='infer')
 
         return data
 
@@ -164,7 +180,7 @@ class GeminiMarket(MarketAPI):
                 level represents offers at that price. Each price level contains another mapping for [price, amount].
                 See
         """
-        response = requests.get(self.BASE_URL + f"/v1/book/{self.symbol}")
+        response = self._session().get(self.BASE_URL + f"/v1/book/{self.symbol}")
         return response.json()
 
     def _post(self, endpoint: str, data: dict = None) -> Union[dict, 'ReasonCode']:
@@ -182,7 +198,8 @@ class GeminiMarket(MarketAPI):
         payload = {"request": endpoint, "nonce": payload_nonce}
         payload.update(data)
 
-        encoded_payload = json.dumps(payload).encode()
+        # compact separators shorten the payload, which is sent base64-encoded as a header
+        encoded_payload = json.dumps(payload, separators=(',', ':')).encode()
         b64 = base64.b64encode(encoded_payload)
         sig = hmac.new(self.api_secret, b64, hashlib.sha384).hexdigest()
 
@@ -196,7 +213,7 @@ class GeminiMarket(MarketAPI):
         }
 
         try:
-            response = requests.post(self.BASE_URL + endpoint, headers=headers, data=None)
+            response = self._session().post(self.BASE_URL + endpoint, headers=headers, data=None)
         except ConnectionError:
             return ReasonCode.POST_ERROR
 
@@ -252,8 +269,7 @@ class GeminiMarket(MarketAPI):
             'amount': trade.amt,
             'price': trade.rate,
             'side': trade.side,
-            'type': "exchange limit",
-            'options': ["fill-or-kill"]
+            **self._ORDER_TEMPLATE
         }
 
         response: Union[dict, 'ReasonCode'] = self._post("/v1/order/new", data)
@@ -320,8 +336,15 @@ class GeminiMarket(MarketAPI):
                 Unit of time to quantize to. Should be written
         """
         # modify `point` to access correct timeframe
-        _freq = self.translate_period(freq)      # `DateOffset` conversion
-        _point = point.floor(_freq, nonexistent='shift_backward')
+        _freq = self._period(freq)      # `DateOffset` conversion
+
+        # quantize using integer arithmetic when local time is aligned with the interval
+        unit = _FLOOR_NS.get(freq)
+        offset = point.utcoffset()
+        if unit is not None and (offset is None or int(offset.total_seconds()) * 10 ** 9 % unit == 0):
+            _point = pd.Timestamp(point.value - point.value % unit, tz=point.tz)
+        else:
+            _point = point.floor(_freq, nonexistent='shift_backward')
         if _freq == '6H':
             # Gemini candle data originates from the 'US/Eastern' timezone
             offset: timedelta = point.tz_convert('US/Eastern').utcoffset() - point.utcoffset()
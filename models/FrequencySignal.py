@@ -1,7 +1,8 @@
 import concurrent.futures
 from math import nan
+import numpy as np
 import pandas as pd
-from typing import List, NoReturn, Union
+from typing import List, NoReturn, Sequence, Union
 
 from core import MarketAPI
 from misc import TZ
@@ -108,8 +109,9 @@ class FrequencySignal(object):
 
         _point = self.market.process_point(point, freq=self.freq)
         signal = self.signal(_point)
-        _strengths = pd.Series([i.strength(_point, self.candles) for i in self.indicators])
-        signals = pd.Series([i.signal(_point, self.candles) for i in self.indicators])
+        candles = self.candles
+        _strengths = pd.Series([i.strength(_point, candles) for i in self.indicators])
+        signals = pd.Series([i.signal(_point, candles) for i in self.indicators])
         if signal != Signal.HOLD:
             strength = _strengths[signals == signal].mean()
         else:
@@ -126,9 +128,10 @@ class FrequencySignal(object):
         Buffering should be accomplished here since each instance directly accesses candle data and there
         shouldn't be any redundant access to specific frequency candle data outside of this functor.
         """
-        self.last_update = self.candles.index[-1]
-        self._process(self.candles)
-        self._compute(self.candles)
+        candles = self.candles
+        self.last_update = candles.index[-1]
+        self._process(candles)
+        self._compute(candles)
 
     def _compute(self, data: pd.DataFrame, buffer: bool = False,
                  executor: concurrent.futures.Executor = None) -> NoReturn:
@@ -153,15 +156,12 @@ class FrequencySignal(object):
             _buffer = data.iloc[_buffer_len - 1:]
 
         if self.threads:
+            # submit all tasks before blocking; `func_threads()` creates a pool when `executor` is not given
+            fs = self.func_threads('compute', executor=executor, candles=_buffer)
 
-            if executor is not None:
-                self.func_threads('compute', executor=executor, candles=_buffer)
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as executor:
-                # Start the load operations and mark each future with its URL
-                fs = self.func_threads('compute', executor=executor, candles=_buffer)
-                concurrent.futures.wait(fs)
-                # result would be accessible by `future.result for future in ...`
+            # propagate any exception raised by workers
+            for future in fs:
+                future.result()
         else:
             [i.compute(_buffer) for i in self.indicators]
 
@@ -188,15 +188,12 @@ class FrequencySignal(object):
             _buffer = data.iloc[_buffer_len - 1:]
 
         if self.threads:
+            # submit all tasks before blocking; `func_threads()` creates a pool when `executor` is not given
+            fs = self.func_threads('process', executor=executor, candles=_buffer)
 
-            if executor is not None:
-                self.func_threads('process', executor=executor, candles=_buffer)
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as executor:
-                # Start the load operations and mark each future with its URL
-                fs = self.func_threads('process', executor=executor, candles=_buffer)
-                concurrent.futures.wait(fs)
-                # result would be accessible by `future.result for future in ...`
+            # propagate any exception raised by workers
+            for future in fs:
+                future.result()
         else:
             [i.process(_buffer) for i in self.indicators]
 
@@ -209,6 +206,24 @@ class FrequencySignal(object):
 
         return [executor.submit(getattr(indicator, func), *args, **kwargs) for indicator in self.indicators]
 
+    @staticmethod
+    def _count_signals(signals: Sequence[Signal]) -> np.ndarray:
+        """ Count occurrences of each `Signal` value.
+
+        Returns:
+            Array of counts where the first element corresponds to `Signal.SELL` and the last to `Signal.BUY`.
+        """
+        return np.bincount(np.asarray(signals, dtype=int) - Signal.SELL, minlength=len(Signal))
+
+    @classmethod
+    def _mode(cls, signals: Sequence[Signal]) -> Signal:
+        """ Return the most common value of `signals`.
+
+        Notes:
+            Ties are resolved by returning the lowest value, as is done by `pd.Series.mode()`.
+        """
+        return Signal(int(cls._count_signals(signals).argmax()) + Signal.SELL)
+
     @staticmethod
     def _conflicting_signals(signals: pd.Series) -> bool:
         """ Return `True` if `signals` contains both BUY AND SELL.
@@ -227,7 +242,7 @@ class FrequencySignal(object):
         Returns:
             True if signals agree, otherwise False
         """
-        unique = len(signals.unique())
+        unique = np.count_nonzero(self._count_signals(signals))
         if self.unison and unique == 1:
             pass
         elif not self.unison and unique <= len(self.indicators) - 1 and \
@@ -266,13 +281,14 @@ class FrequencySignal(object):
         if self.threads and False:
             fs = self.func_threads('signal', executor=executor,
                                    point=point, candles=self.candles)
-            signals = pd.Series([future.result() for future in concurrent.futures.wait(fs)[0]])
+            signals = pd.Series([future.result() for future in fs])
 
         else:
-            signals = pd.Series([i.signal(point, self.candles) for i in self.indicators])
+            candles = self.candles
+            signals = pd.Series([i.signal(point, candles) for i in self.indicators])
 
         if self._consensus(signals):
-            return Signal(signals.mode()[0])
+            return self._mode(signals)
 
         return Signal.HOLD
 
@@ -289,8 +305,9 @@ class FrequencySignal(object):
             return None
 
         else:
-            strengths = pd.Series([i.strength(point, self.candles) for i in self.indicators])
-            signals = pd.Series([i.signal(point, self.candles) for i in self.indicators])
+            candles = self.candles
+            strengths = pd.Series([i.strength(point, candles) for i in self.indicators])
+            signals = pd.Series([i.signal(point, candles) for i in self.indicators])
 
             _mean = strengths[signals == signal].mean()
             if _mean < 1:
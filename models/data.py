@@ -1,21 +1,24 @@
+from dateutil.tz import tzlocal
+import numpy as np
 import pandas as pd
 import requests
 from os import path
-from datetime import datetime
 
 
 def json_to_df(data) -> pd.DataFrame:
     """ Convert timestamp and add columns to raw data.
+
+    Notes:
+        Rows are parsed into a single array, and timestamps are converted at once instead of row by row. Timestamps are
+        naive local time, as with `datetime.fromtimestamp()`. Each column of the returned frame is contiguous.
     """
-    _data = data
-    for i in _data:
-        i[0] = datetime.fromtimestamp(i[0] / 1000)    # convert milliseconds to seconds
-    df = pd.DataFrame(_data, columns=['dt', 'open', 'high', 'low', 'close', 'volume'])
-    df.index = pd.DatetimeIndex(df['dt'])
-    del df['dt']
-    del _data
-
-    return df
+    values = np.ascontiguousarray(np.asarray(data, dtype=float).reshape(-1, 6).T)
+
+    # convert milliseconds to local time
+    index = pd.to_datetime(values[0].astype('int64'), unit='ms', utc=True)
+    index = index.tz_convert(tzlocal()).tz_localize(None).rename('dt')
+
+    return pd.DataFrame(values[1:].T, index=index, columns=['open', 'high', 'low', 'close', 'volume'])
 
 
 def get_candles(t='1m') -> pd.DataFrame:
@@ -110,14 +110,43 @@ class Indicator(ABC):
         assert not self.graph.empty
         assert not candles.empty
 
-        # TODO: vectorizing computation across columns should provide greater speed increase
+        self.computed['signal'] = self._decisions(candles)
+        self.computed['strength'] = self._strengths(candles)
+
+    def _decisions(self, candles: pd.DataFrame) -> pd.Series:
+        """ Derive `Signal` for every row of `graph`.
+
+        Default implementation calls `_row_decision()` once per row. Subclasses should override this with a
+        vectorized equivalent since `compute()` is called on every update.
+
+        Args:
+            candles:
+                Market candle data which `graph` was derived from.
+
+        Returns:
+            `Signal` values indexed by `graph.index`
+        """
         # TODO: setting `raw` flag to true should increase speed according to docs, however,
         #   DataFrame gets passed as ndarray, and it is not clear how it is converted to an `ndarray`
 
         # NOTE: in order to debug `apply()`, place breakpoint at the nested function `f()` in `Apply.__init__()`.
         # This can be found at "pandas/core/apply.py:139"
-        self.computed['signal'] = self.graph.apply(self._row_decision, axis='columns', candles=candles)
-        self.computed['strength'] = self.graph.apply(self._row_strength, axis='columns', candles=candles)
+        return self.graph.apply(self._row_decision, axis='columns', candles=candles)
+
+    def _strengths(self, candles: pd.DataFrame) -> pd.Series:
+        """ Derive strength for every row of `graph`.
+
+        Default implementation calls `_row_strength()` once per row. Subclasses should override this with a
+        vectorized equivalent, which must agree with `_row_strength()`.
+
+        Args:
+            candles:
+                Market candle data which `graph` was derived from.
+
+        Returns:
+            Strength values indexed by `graph.index`
+        """
+        return self.graph.apply(self._row_strength, axis='columns', candles=candles)
 
     @abstractmethod
     def _row_decision(self, row: Union['pd.Series', 'pd.DataFrame'], candles: pd.DataFrame) -> Signal:
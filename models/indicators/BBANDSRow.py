@@ -1,4 +1,5 @@
 from math import isnan, nan
+import numpy as np
 import pandas as pd
 from talib import BBANDS
 from typing import Union, Tuple
@@ -41,6 +42,31 @@ class BBANDSRow(Indicator):
             point = row.name
         return float(candles.loc[point, self._source])
 
+    def _bands(self, candles: pd.DataFrame) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """ Vectorized equivalent of `_extract_rate()` and `_calculate_thresholds()` across all of `graph` """
+        rate = candles[self._source].reindex(self.graph.index)
+
+        lower = self.graph['lowerband']
+        middle = self.graph['middleband']
+        buy = lower + (middle - lower) * (1 - self.threshold)
+        sell = middle + (self.graph['upperband'] - middle) * self.threshold
+
+        return rate, buy, sell
+
+    def _decisions(self, candles: pd.DataFrame) -> pd.Series:
+        rate, buy, sell = self._bands(candles)
+        return pd.Series(np.select([rate <= buy, rate >= sell], [Signal.BUY, Signal.SELL], Signal.HOLD),
+                         index=self.graph.index)
+
+    def _strengths(self, candles: pd.DataFrame) -> pd.Series:
+        rate, buy, sell = self._bands(candles)
+        lower = self.graph['lowerband']
+        upper = self.graph['upperband']
+
+        below = np.select([rate > lower, rate > lower - (buy - lower)], [1, 2], 3)
+        above = np.select([rate < upper, rate < upper + (upper - sell)], [1, 2], 3)
+        return pd.Series(np.select([rate <= buy, rate >= sell], [below, above], nan), index=self.graph.index)
+
     def _row_decision(self, row: Union['pd.Series', 'pd.DataFrame'], candles: pd.DataFrame = None) -> Signal:
         # hack to unpack `point` from row
         rate = self._extract_rate(row, candles)
@@ -1,7 +1,8 @@
 from math import isnan, nan
+import numpy as np
 import pandas as pd
 from talib import MACD
-from typing import Union, Iterable
+from typing import Union, Iterable, Tuple
 
 from models.indicator import Indicator, MAX_STRENGTH
 from primitives import Signal
@@ -52,6 +53,28 @@ class MACDRow(Indicator):
         normal = (value - _min) / scalar
         return normal * MAX_STRENGTH
 
+    def _crossings(self) -> Tuple[pd.Series, pd.Series]:
+        """ Boolean masks of rows where `_row_decision()` returns `BUY` and `SELL`, respectively """
+        macd = self.graph['macd']
+        signal = self.graph['macdsignal']
+        return (macd < signal) & (signal < 0), (macd > signal) & (signal > 0)
+
+    def _decisions(self, candles: pd.DataFrame) -> pd.Series:
+        buy, sell = self._crossings()
+        return pd.Series(np.select([buy, sell], [Signal.BUY, Signal.SELL], Signal.HOLD), index=self.graph.index)
+
+    def _strengths(self, candles: pd.DataFrame) -> pd.Series:
+        buy, sell = self._crossings()
+
+        # expanding extrema are equivalent to calling `normalize()` for each point
+        hist = self.graph['macdhist'].abs()
+        _min = hist.expanding().min()
+        scalar = hist.expanding().max() - _min
+
+        normal = (hist - _min) / scalar * MAX_STRENGTH
+        normal[(scalar == 0) & hist.notna()] = 0
+        return normal.where(buy | sell)
+
     def _row_decision(self, row: Union['pd.Series', 'pd.DataFrame'], candles: pd.DataFrame = None) -> Signal:
         signal = row['macdsignal']
         macd = row['macd']
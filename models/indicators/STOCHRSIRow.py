@@ -1,7 +1,8 @@
 from math import fabs, isnan, ceil, nan
+import numpy as np
 import pandas as pd
 from talib import STOCHRSI
-from typing import Union
+from typing import Union, Tuple
 
 from models.indicator import Indicator
 from primitives import Signal
@@ -27,6 +28,21 @@ class STOCHRSIRow(Indicator):
     def overbought(self, d: float, k: float) -> bool:
         return self._overbought > d >= k
 
+    def _crossings(self) -> Tuple[pd.Series, pd.Series]:
+        """ Boolean masks of rows which are `overbought()` and `oversold()`, respectively """
+        k = self.graph['fastk']
+        d = self.graph['fastd']
+        return (d < self._overbought) & (d >= k), (d > self._oversold) & (d <= k)
+
+    def _decisions(self, candles: pd.DataFrame) -> pd.Series:
+        buy, sell = self._crossings()
+        return pd.Series(np.select([buy, sell], [Signal.BUY, Signal.SELL], Signal.HOLD), index=self.graph.index)
+
+    def _strengths(self, candles: pd.DataFrame) -> pd.Series:
+        buy, sell = self._crossings()
+        val = (self.graph['fastk'] - self.graph['fastd']).abs()
+        return np.maximum(np.ceil(val / 4), 1).where(buy | sell)
+
     def _row_decision(self, row: Union['pd.Series', 'pd.DataFrame'], candles: pd.DataFrame = None) -> Signal:
         fastk = row['fastk']
         fastd = row['fastd']
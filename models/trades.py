@@ -4,6 +4,9 @@ Notes:
     By using dataclasses inside `DataFrame`, data structure has more rigidity and boilerplate
     can be reduced. Columns are standardized and error is reduced when setting values (eg: positional arguments out of
     order, or mistyped values), and allows the use of properties as columns.
+
+    Trades are created for every order and every simulated trade, therefore dataclasses use `__slots__` instead of
+    an instance `__dict__`. Attributes that are not fields cannot be set.
 """
 
 from dataclasses import dataclass, field, fields
@@ -14,7 +17,7 @@ from misc import TZ
 from primitives import Side, ReasonCode
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """ Abstraction for theoretical trade.
 
@@ -51,7 +54,7 @@ class Trade:
         return containerize(cls)
 
 
-@dataclass
+@dataclass(slots=True)
 class FutureTrade(Trade):
     attempt: bool
     point: pd.Timestamp
@@ -77,7 +80,7 @@ class FutureTrade(Trade):
         return self._trade(), self.point
 
 
-@dataclass
+@dataclass(slots=True)
 class SuccessfulTrade(Trade):
     id: field(default_factory=str)
 
@@ -86,7 +89,7 @@ class SuccessfulTrade(Trade):
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class FailedTrade(Trade):
     reason: ReasonCode
 
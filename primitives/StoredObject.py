@@ -3,7 +3,7 @@ import numpy as np
 from os import path, mkdir
 from pathlib import Path
 import pandas as pd
-from typing import List, Iterable, NoReturn, ClassVar
+from typing import List, Iterable, NoReturn, ClassVar, Optional
 from warnings import warn
 import yaml
 
@@ -24,8 +24,16 @@ def timestamp_constructor(loader, node):
     return pd.Timestamp(node.value)
 
 
+# use libyaml bindings when available since the pure-Python implementation dominates save and load times
+_Dumper = getattr(yaml, 'CDumper', yaml.Dumper)
+_Loader = getattr(yaml, 'CFullLoader', yaml.FullLoader)
+
 yaml.add_representer(pd.Timestamp, timestamp_representer)
 yaml.add_constructor(TIMESTAMP_REPR_STR, timestamp_constructor)
+if _Dumper is not yaml.Dumper:
+    yaml.add_representer(pd.Timestamp, timestamp_representer, Dumper=_Dumper)
+if _Loader is not yaml.FullLoader:
+    yaml.add_constructor(TIMESTAMP_REPR_STR, timestamp_constructor, Loader=_Loader)
 
 
 class StoredObject(ABC):
@@ -84,19 +92,37 @@ class StoredObject(ABC):
 
         # store literal parameters
         with open(path.join(_dir, _LITERALS_FN), 'w') as f:
-            yaml.dump(_literals, f)
+            yaml.dump(_literals, f, Dumper=_Dumper)
 
         # store sequence data
         for attr in _df_keys:
-            with open(path.join(_dir, f"{attr}.yml"), 'w') as f:
-                yaml.dump(getattr(self, attr).to_dict(orient='index'), f)
+            self._save_frame(attr, getattr(self, attr))
 
         for attr in _sequence_keys:
             with open(path.join(_dir, f"{attr}.yml"), 'w') as f:
-                yaml.dump(getattr(self, attr).to_list(), f)
+                yaml.dump(getattr(self, attr).to_list(), f, Dumper=_Dumper)
 
         print(f"Finished saving {self.__name__}")
 
+    def _save_frame(self, attr: str, frame: pd.DataFrame) -> NoReturn:
+        """ Store `frame` as sequence data for `attr` in instance directory. """
+        with open(path.join(self._instance_dir, f"{attr}.yml"), 'w') as f:
+            # rows and columns keep their order
+            yaml.dump(frame.to_dict(orient='index'), f, Dumper=_Dumper, sort_keys=False)
+
+    def _load_frame(self, attr: str) -> Optional[pd.DataFrame]:
+        """ Load sequence data for `attr` stored by `_save_frame()`.
+
+        Returns:
+            `None` if no sequence data has been stored for `attr`.
+        """
+        try:
+            with open(Path(self._instance_dir, f"{attr}.yml"), 'r') as f:
+                container = yaml.load(f, Loader=_Loader)
+        except FileNotFoundError:
+            return None
+        return pd.DataFrame.from_dict(container, orient="index")
+
     def load(self, ignore_exclude: bool = False) -> NoReturn:
         """ Load stored attributes and sequence data from instance directory onto memory.
 
@@ -122,7 +148,7 @@ class StoredObject(ABC):
 
         # load `_literals`. Literals should be verified (ie: not be a function)
         with open(_literals_fn, 'r') as f:
-            _literals: dict = yaml.full_load(f)
+            _literals: dict = yaml.load(f, Loader=_Loader)
             for k, v in _literals.items():
                 # verify data
                 # excluded values could be filtered here, but is handled below instead.
@@ -139,7 +165,7 @@ class StoredObject(ABC):
                 continue
             try:
                 with open(Path(_dir, f"{k}.yml"), 'r') as f:
-                    container = yaml.full_load(f)
+                    container = yaml.load(f, Loader=_Loader)
                     if _t == pd.DataFrame:
                         _seq = pd.DataFrame.from_dict(container, orient="index")
                     elif _t == pd.Series:
@@ -1,13 +1,15 @@
 from datetime import datetime, timedelta
 import logging
-from typing import Any, Callable, Tuple, Dict
+import threading
+import time
+from typing import Any, Callable, Tuple, Dict, Optional
 
 from misc import TZ
 
 
 class CachedValue(object):
     def __init__(self, func: Callable = None, *args, timeout: timedelta = timedelta(hours=1),
-                 default: Any = None, **kwargs):
+                 default: Any = None, lazy: bool = False, **kwargs):
         assert issubclass(type(timeout), timedelta)
 
         self.func: Callable = func
@@ -15,18 +17,35 @@ class CachedValue(object):
         self.kwargs: Dict = kwargs
 
         self._value: Any = None
-        self.default = None
+        self.default = default
 
         self.timeout: timedelta = timeout
-        self.last_updated = None
+        self.last_updated: Optional[datetime] = None
 
-        self.update()
+        self._expires: float = 0.
+        """ Monotonic time when value becomes stale. Used when no `point` is passed to `__call__()`. """
 
-    def __call__(self, point: datetime = datetime.now(tz=TZ)):
-        if self.timeout < point - self.last_updated:
-            self.last_updated = point
+        self._lock = threading.Lock()
+        """ Held while refreshing so that concurrent callers do not call `func` more than once. """
+
+        if not lazy:
+            self.update()
+
+    def __call__(self, point: datetime = None):
+        if point is None:
+            # compare against a monotonic clock since building an aware `datetime` on every access is comparatively slow
+            if time.monotonic() < self._expires:
+                return self._value
+        elif self.last_updated is not None and point - self.last_updated <= self.timeout:
+            return self._value
+
+        with self._lock:
+            # value might have been refreshed by another thread while waiting
+            if point is None and time.monotonic() < self._expires:
+                return self._value
+
+            # `update()` only marks the value as fresh when `func` succeeds so that a failed fetch is retried
             return self.update()
-        return self._value
 
     def _call(self):
         return self.func(*self.args, **self.kwargs)
@@ -36,6 +55,7 @@ class CachedValue(object):
             _value = self._call()
             self._value = _value
             self.last_updated = datetime.now(tz=TZ)
+            self._expires = time.monotonic() + self.timeout.total_seconds()
         except ConnectionError as e:
             logging.warning("Deferring to cached value")
             if self._value is not None:
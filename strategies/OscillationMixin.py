@@ -131,8 +131,8 @@ class OscillationMixin(FinancialsMixin, ABC):
         TODO:
             - Pass trend strength (if trend is bear market) and permit buys if trend is strong enough
         """
-        last = self.orders.iloc[-1].name
-        last = pd.Timestamp.fromtimestamp(last.timestamp(), tz=TZ)
+        last = self.orders.index[-1]
+        last = pd.Timestamp(last.value, tz=TZ)
         if point:
             now = point
         else:
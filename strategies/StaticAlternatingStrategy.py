@@ -121,7 +121,7 @@ class StaticAlternatingStrategy(Strategy):
                 side = Side.SELL
 
         if not extrema:
-            extrema = self.market.data.iloc[-1].name
+            extrema = self.market.data.index[-1]
 
         rate = self._calc_rate(extrema, side)
         amount = self._calc_amount(extrema, side)
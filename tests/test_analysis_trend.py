@@ -1,3 +1,4 @@
+import concurrent.futures
 from math import nan
 from typing import List
 
@@ -5,7 +6,7 @@ import pandas as pd
 import unittest
 from unittest.mock import patch, MagicMock
 
-from analysis.trend import TrendDetector
+from analysis.trend import TrendDetector, _update_worker
 from primitives import TrendDirection, MarketTrend, Signal
 from misc import TZ
 
@@ -66,6 +67,18 @@ class TrendDetectorTests(unittest.TestCase):
             self.detector._indicators = []
             self.detector.update()
 
+    def test_update_worker(self):
+        # assert that indicators are processed, computed, then returned
+        _candles = pd.DataFrame([0, 1, 2])
+        indicators = [MagicMock(), MagicMock()]
+
+        result = _update_worker(indicators, _candles)
+
+        self.assertIs(result, indicators)
+        for i in indicators:
+            i.process.assert_called_once_with(_candles)
+            i.compute.assert_called_once_with(_candles)
+
     def test_determine_scalar(self):
         idx = self.index[-1]        # this is a placeholder since returned value is mock
         self.market.process_point = MagicMock(return_value=idx)
@@ -99,6 +112,30 @@ class TrendDetectorTests(unittest.TestCase):
 
         self.assertEqual(1, self.detector._determine_scalar(TrendDirection.DOWN, idx))
 
+    def test_determine_scalar_threaded(self):
+        # assert that the threaded path returns the same value as the single-threaded path
+        idx = self.index[-1]
+        self.market.process_point = MagicMock(return_value=idx)
+        self.detector.candles = MagicMock(return_value=pd.DataFrame())
+        self.detector.threads = 1
+
+        cases = [(TrendDirection.UP, [TrendDirection.UP, TrendDirection.CYCLE, TrendDirection.UP], [2, nan, 4]),
+                 (TrendDirection.DOWN, [TrendDirection.DOWN, TrendDirection.DOWN, TrendDirection.UP], [1, nan, 4]),
+                 (TrendDirection.UP, [TrendDirection.UP, TrendDirection.DOWN, TrendDirection.UP], [5, 9, 0.5])]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            for trend, signals, strengths in cases:
+                self.set_indicator_computed(idx, signals, strengths)
+                # threaded path reads each value from the indicator rather than from `computed`
+                for container in self.detector._indicators.values():
+                    for i in container.indicators:
+                        row = i.computed.iloc[0]
+                        i.signal = MagicMock(return_value=row['signal'])
+                        i.strength = MagicMock(return_value=row['strength'])
+
+                expected = self.detector._determine_scalar(trend, idx)
+                result = self.detector._determine_scalar(trend, idx, executor)
+                self.assertEqual(expected, result)
+
     def test_characterize(self):
         # setup mock functions
         self.detector._fetch_trend = MagicMock(return_value=TrendDirection.UP)
@@ -112,6 +149,24 @@ class TrendDetectorTests(unittest.TestCase):
         self.assertEqual(trend.trend, TrendDirection.UP)
         self.assertEqual(trend.scalar, 1)
 
+    def test_characterize_cached(self):
+        # assert that result is reused when there is no new candle data
+        self.detector._fetch_trend = MagicMock(return_value=TrendDirection.UP)
+        self.detector._determine_scalar = MagicMock(return_value=1)
+        self.market.most_recent_timestamp = self.index[-1]
+
+        trend = self.detector.characterize()
+        self.assertIs(trend, self.detector.characterize())
+        self.detector._fetch_trend.assert_called_once()
+
+        # assert that cache is cleared by `update()`
+        for container in self.detector._indicators.values():
+            container.update = MagicMock()
+        self.detector.update()
+
+        self.assertIsNot(trend, self.detector.characterize())
+        self.assertEqual(2, self.detector._fetch_trend.call_count)
+
     def test_fetch_trend(self):
         idx = self.index[-1]        # this is a placeholder since returned value is mock
         self.set_indicator_attr('signal', [TrendDirection.UP, TrendDirection.CYCLE, TrendDirection.UP])
@@ -122,6 +177,25 @@ class TrendDetectorTests(unittest.TestCase):
         # assert that highest occurring value is returned
         self.assertEqual(trend, TrendDirection.UP)
 
+    def test_process_points(self):
+        idx = self.index[-1]
+        self.market.process_point = MagicMock(return_value=idx)
+
+        points = self.detector._process_points(idx)
+        self.assertEqual(tuple(points.keys()), FREQUENCIES)
+
+        # assert that `market.process_point()` is only called once per frequency
+        self.assertIs(points, self.detector._process_points(idx))
+        self.assertEqual(len(FREQUENCIES), self.market.process_point.call_count)
+
+        # assert that cache is cleared by `update()`
+        for container in self.detector._indicators.values():
+            container.update = MagicMock()
+        self.detector.update()
+
+        self.detector._process_points(idx)
+        self.assertEqual(2 * len(FREQUENCIES), self.market.process_point.call_count)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from misc import TZ
+from models.indicators import BBANDSRow, MACDRow, STOCHRSIRow
+
+
+class VectorizedIndicatorTestCase(unittest.TestCase):
+    """ Assert that vectorized `_decisions()`/`_strengths()` agree with `_row_decision()`/`_row_strength()` """
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.index = pd.date_range(pd.Timestamp.now(), tz=TZ, freq='15min', periods=50)
+        self.candles = pd.DataFrame({'close': rng.uniform(90, 110, 50)}, index=self.index)
+
+        middle = pd.Series(rng.uniform(95, 105, 50), index=self.index)
+        width = pd.Series(rng.uniform(1, 10, 50), index=self.index)
+        self.graphs = {
+            BBANDSRow: pd.DataFrame({'upperband': middle + width, 'middleband': middle,
+                                     'lowerband': middle - width}),
+            MACDRow: pd.DataFrame({'macd': rng.uniform(-1, 1, 50), 'macdsignal': rng.uniform(-1, 1, 50),
+                                   'macdhist': rng.uniform(-1, 1, 50)}, index=self.index),
+            STOCHRSIRow: pd.DataFrame({'fastk': rng.uniform(0, 100, 50), 'fastd': rng.uniform(0, 100, 50)},
+                                      index=self.index),
+        }
+        for graph in self.graphs.values():
+            # leading rows are undefined before indicator has enough data
+            graph.iloc[:5] = np.nan
+
+    def test_vectorized(self):
+        for cls, graph in self.graphs.items():
+            with self.subTest(indicator=cls.name):
+                obj = cls()
+                obj.graph = graph
+
+                expected = graph.apply(obj._row_decision, axis='columns', candles=self.candles)
+                self.assertTrue(np.array_equal(expected.astype(int).values, obj._decisions(self.candles).values))
+
+                expected = graph.apply(obj._row_strength, axis='columns', candles=self.candles)
+                self.assertTrue(np.allclose(expected.astype(float).values, obj._strengths(self.candles).values,
+                                            equal_nan=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
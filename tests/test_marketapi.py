@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 from pytz import timezone
 from shutil import rmtree
+import sys
 import unittest
 from unittest.mock import patch, MagicMock, PropertyMock
 from yaml import safe_dump, safe_load
@@ -16,7 +17,7 @@ from core import MarketAPI
 class BaseMarketAPITests(unittest.TestCase):
     valid_freqs = ['D', '1h', '6h', '1d', '4h']
 
-    @patch("core.MarketAPI.__abstractmethods__", set())
+    @patch.multiple(MarketAPI, __abstractmethods__=set())
     def setUp(self) -> None:
         self.args = {'api_key': 'key', 'api_secret': 'secret', 'update': False, 'load': False,
                      'auto_update': False}
@@ -62,8 +63,8 @@ class CheckTZTests(BaseMarketAPITests):
         # assert that global timezone can be overwritten
         new_tz_n = 'MST'
         new_tz = timezone(new_tz_n)
-        with patch('core.MarketAPI._global_tz',
-                   new_callable=PropertyMock(return_value=new_tz_n)):
+        with patch.object(MarketAPI, '_global_tz',
+                          new_callable=PropertyMock(return_value=new_tz_n)):
             self.market._check_tz()
             self.assertEqual(self.market.tz, new_tz)
 
@@ -82,13 +83,56 @@ class CheckTZTests(BaseMarketAPITests):
         self.market._data = _data.copy()
 
         new_tz_n = 'MST'
-        with patch('core.MarketAPI._global_tz',
-                   new_callable=PropertyMock(return_value=new_tz_n)):
+        with patch.object(MarketAPI, '_global_tz',
+                          new_callable=PropertyMock(return_value=new_tz_n)):
             self.market._check_tz()
 
         self.assertTrue(np.array_equal(_data.values, self.market._data.values))
 
 
+class DataTests(BaseMarketAPITests):
+    def test_concatenated(self):
+        index = self._create_multiindex(start="12/12/2012")
+        self.market._data = pd.DataFrame({0: range(len(index))}, index=index)
+        data = self.market._data
+
+        # assert that replacing a frame is reflected by `_data`
+        freq = self.valid_freqs[0]
+        self.market._frames[freq] = self.market._frames[freq].iloc[:-1]
+        self.assertEqual(len(data) - 1, len(self.market._data))
+
+    def test_most_recent_timestamp(self):
+        index = self._create_multiindex(start="12/12/2012")
+        self.market._data = pd.DataFrame({0: range(len(index))}, index=index)
+
+        # assert that latest timestamp across all frequencies is returned
+        freq = self.valid_freqs[0]
+        self.market._frames[freq] = self.market._frames[freq].iloc[:-1]
+        expected = max(frame.index[-1] for frame in self.market._frames.values())
+        self.assertEqual(expected, self.market.most_recent_timestamp)
+        self.assertIsInstance(self.market.most_recent_timestamp, pd.Timestamp)
+
+
+class StaleCandlesTests(BaseMarketAPITests):
+    def test_stale(self):
+        now = pd.Timestamp.now(tz='UTC')
+        fresh = pd.date_range(end=now, periods=3, freq='1h')
+        old = pd.date_range(end=now - pd.Timedelta('10d'), periods=3, freq='1h')
+
+        self.market._frames = {freq: pd.DataFrame({0: [0, 1, 2]}, index=old) for freq in self.valid_freqs}
+        self.market._frames['1h'] = pd.DataFrame({0: [0, 1, 2]}, index=fresh)
+        self.market._frames['1d'] = pd.DataFrame({0: [0, 1, 2]}, index=fresh)
+        del self.market._frames['4h']
+
+        # assert that missing candle data is stale
+        expected = tuple(freq for freq in self.valid_freqs if freq not in ('1h', '1d'))
+        self.assertEqual(expected, self.market._stale_candles)
+
+        # assert that results agree with `_check_candle_age()`
+        for freq in self.valid_freqs:
+            self.assertEqual(freq in expected, self.market._check_candle_age(freq))
+
+
 class CombineCandlesTests(BaseMarketAPITests):
     def setUp(self):
         super().setUp()
@@ -192,6 +236,56 @@ class RepairCandlesTests(BaseMarketAPITests):
         self.assertTrue(bool(isin.any()))
         self.assertEqual(2, result.iloc[1].values)
 
+    def test_uniform(self):
+        # assert that candle data without gaps is returned as-is
+        _freq = 'D'
+        self.market.translate_period = MagicMock(return_value=_freq)
+        idx = pd.date_range("1/1/2023", "1/5/2023", freq=_freq)
+        df = pd.DataFrame([1, 2, 3, 4, 5], index=idx)
+        result = self.market._repair_candles(df, _freq)
+        self.assertTrue(result.equals(df))
+
+        # assert that missing values are still interpolated
+        df.iloc[2] = np.nan
+        result = self.market._repair_candles(df, _freq)
+        self.assertEqual(3, result.iloc[2].values)
+
+    def test_regular_duplicates(self):
+        # assert that duplicated timestamps keep first value when gaps are filled arithmetically
+        _freq = '1h'
+        self.market.translate_period = MagicMock(return_value='H')
+        idx = pd.DatetimeIndex(["1/1/2023 00:00", "1/1/2023 01:00", "1/1/2023 01:00", "1/1/2023 03:00"])
+        df = pd.DataFrame([0, 1, 9, 3], index=idx)
+        result = self.market._repair_candles(df, _freq)
+
+        self.assertTrue(result.index.is_unique)
+        self.assertTrue(result.index.is_monotonic_increasing)
+        self.assertEqual(4, len(result))
+
+        expected = pd.date_range("1/1/2023 00:00", "1/1/2023 03:00", freq='H')
+        self.assertTrue(result.index.equals(expected))
+        self.assertEqual([0, 1, 2, 3], list(result[0].values))
+
+    def test_contiguous_columns(self):
+        # assert that repaired columns are contiguous
+        _freq = '1h'
+        self.market.translate_period = MagicMock(return_value='H')
+        idx = pd.DatetimeIndex(["1/1/2023 00:00", "1/1/2023 01:00", "1/1/2023 03:00"])
+        df = pd.DataFrame({'open': [0., 1., 3.], 'close': [1., 2., 4.]}, index=idx)
+        result = self.market._repair_candles(df, _freq)
+
+        self.assertEqual([0., 1., 2., 3.], list(result['open'].values))
+        for column in result.columns:
+            self.assertTrue(result[column].to_numpy().flags['C_CONTIGUOUS'])
+
+    def test_interpolate(self):
+        # assert that values are interpolated the same as `DataFrame.interpolate()`
+        nan = np.nan
+        df = pd.DataFrame({'a': [nan, 1, nan, nan, 4, nan], 'b': [0, nan, 2, 3, nan, 5], 'c': [nan] * 6})
+        values = df.to_numpy(copy=True)
+        self.market._interpolate(values)
+        self.assertTrue(np.allclose(df.interpolate().values, values, equal_nan=True))
+
     def test_duplicates(self):
         # assert that duplicates are dropped
         self.skipTest('')
@@ -212,6 +306,77 @@ class RepairCandlesTests(BaseMarketAPITests):
         self.skipTest('')
 
 
+class FetchCandlesTests(BaseMarketAPITests):
+    def test_since(self):
+        # assert that only candle data at or after `since` is repaired
+        _freq = 'D'
+        idx = pd.date_range("1/1/2023", "1/5/2023", freq=_freq)
+        df = pd.DataFrame([1, 2, 3, 4, 5], index=idx)
+        self.market._fetch_candles = MagicMock(return_value=df)
+        self.market._repair_candles = MagicMock(side_effect=lambda data, freq: data)
+
+        result = self.market.fetch_candles(_freq, since=idx[2])
+        self.assertTrue(result.index.equals(idx[2:]))
+        self.market._repair_candles.assert_called_once()
+
+        # assert that all candle data is returned without `since`
+        result = self.market.fetch_candles(_freq)
+        self.assertTrue(result.index.equals(idx))
+
+
+class UpdateTests(BaseMarketAPITests):
+    def test_unsaved(self):
+        # assert that candle data fetched without saving is saved by a later update
+        idx = pd.date_range("1/1/2023", periods=3, freq='1h', tz='UTC')
+        fetched = {'1h': pd.DataFrame({0: [0, 1, 2]}, index=idx)}
+        self.market._fetch_frequencies = MagicMock(return_value=fetched)
+        self.market.save = MagicMock()
+
+        self.market.update(load=False, save=False)
+        self.assertEqual({'1h'}, self.market._unsaved)
+        self.market.save.assert_not_called()
+
+        # nothing is stale during the second update
+        self.market._fetch_frequencies = MagicMock(return_value={})
+        self.market.update(load=False, save=True)
+        self.market.save.assert_called_once_with(frequencies=['1h'])
+
+        # assert that nothing is written when candle data is unchanged
+        self.market.save.reset_mock()
+        self.market._unsaved.clear()
+        self.market.update(load=False, save=True)
+        self.market.save.assert_not_called()
+
+
+class SaveToDBTests(BaseMarketAPITests):
+    def test_frames_read_before_transaction(self):
+        # assert that candle data is written without calling `candles()` while the transaction is open
+        idx = pd.date_range("1/1/2023", periods=3, freq='1h', tz='UTC')
+        frames = {freq: MagicMock() for freq in self.valid_freqs}
+        self.market._frames = dict(frames)
+        self.market._unsaved = set(self.valid_freqs)
+        self.market.candles = MagicMock()
+
+        # a frequency updated while writing is replaced by a new frame
+        def _replace(*args, **kwargs):
+            self.market._frames['1h'] = pd.DataFrame({0: [0, 1, 2]}, index=idx)
+        frames['1h'].to_sql.side_effect = _replace
+
+        with patch.object(sys.modules[MarketAPI.__module__], 'ENGINE') as engine:
+            self.market.save_to_db()
+            engine.begin.assert_called_once()
+
+        self.market.candles.assert_not_called()
+        for frame in frames.values():
+            frame.to_sql.assert_called_once()
+        self.assertEqual({'1h'}, self.market._unsaved)
+
+        # assert that frequencies without candle data are skipped
+        del self.market._frames['4h']
+        with patch.object(sys.modules[MarketAPI.__module__], 'ENGINE'):
+            self.market.save_to_db()
+
+
 class InstanceTests(BaseMarketAPITests):
     def setUp(self) -> None:
         super().setUp()
@@ -230,7 +395,7 @@ class InstanceTests(BaseMarketAPITests):
         self.assertEqual(len(self.market.instances), 1)
         self.assertIn('_data', self.market.exclude)
 
-    @patch("core.MarketAPI.__abstractmethods__", set())
+    @patch.multiple(MarketAPI, __abstractmethods__=set())
     def test_restore(self):
         params = [{'symbol': 'btcusd'},
                   {'symbol': 'ethusd'},
@@ -255,7 +420,38 @@ class InstanceTests(BaseMarketAPITests):
             instance = self.market.instances[s]
             self.assertEqual(getattr(instance, 'symbol'), param['symbol'])
 
-    @patch("core.MarketAPI.__abstractmethods__", set())
+        # assert that restoring again replaces previously restored instances
+        restored = dict(self.market._restored)
+        with patch.object(self.market.__class__, 'load'):
+            self.market.restore()
+        self.assertEqual(restored.keys(), self.market._restored.keys())
+        for key, instance in restored.items():
+            self.assertIsNot(instance, self.market._restored[key])
+            self.assertIs(self.market._restored[key], self.market.instances[key])
+
+    def test_ignore_exclude(self):
+        # assert that candle data is saved and loaded when `ignore_exclude` is set
+        idx = pd.date_range("1/1/2023", periods=3, freq='1h', tz='UTC')
+        frames = {freq: pd.DataFrame({'open': [0., 1., 2.], 'close': [1., 2., 3.]}, index=idx)
+                  for freq in self.valid_freqs}
+        self.market._frames = dict(frames)
+        self.market.save_to_db = MagicMock()
+        self.market.load_from_db = MagicMock()
+
+        self.market.save(ignore_exclude=True)
+        self.assertTrue(path.exists(path.join(self.market._instance_dir, '_data.yml')))
+
+        # assert that excluded candle data is not loaded by default
+        self.market._frames = {}
+        self.market.load()
+        self.assertEqual({}, self.market._frames)
+
+        self.market.load(ignore_exclude=True)
+        self.assertEqual(set(frames.keys()), set(self.market._frames.keys()))
+        for freq, frame in frames.items():
+            pd.testing.assert_frame_equal(frame, self.market._frames[freq], check_freq=False)
+
+    @patch.multiple(MarketAPI, __abstractmethods__=set())
     def test_snapshot(self):
         instances = [self._class(symbol='btcusd', **self.args),
                      self._class(symbol='ethusd', **self.args),
@@ -131,6 +131,11 @@ class BasicFrequencySignalTests(BaseFrequencySignal):
         self.assertEqual(HOMOGENOUS.expected.signal, signal)
         self.assertEqual(HOMOGENOUS.expected.strength, strength)
 
+    def test_mode(self):
+        """ Most common value is returned, and ties resolve to the lowest value """
+        self.assertEqual(Signal.SELL, self.obj._mode([Signal.SELL, Signal.BUY, Signal.SELL]))
+        self.assertEqual(Signal.HOLD, self.obj._mode([Signal.BUY, Signal.HOLD]))
+
 
 class TestUnisonTrue(BaseFrequencySignal):
     """ Assert that heterogeneous values return `CYCLE` when `unison=True`. """
@@ -0,0 +1,78 @@
+from datetime import timedelta
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from primitives import CachedValue
+
+
+class CachedValueTests(unittest.TestCase):
+    def test_cached(self):
+        """ Test that `func` is not called again before `timeout` elapses. """
+        func = MagicMock(return_value=1)
+        cached = CachedValue(func)
+
+        self.assertEqual(1, cached())
+        self.assertEqual(1, cached())
+        func.assert_called_once()
+
+    def test_fallback(self):
+        """ Test that `default` is returned on every call while `func` raises `ConnectionError`. """
+        func = MagicMock(side_effect=ConnectionError)
+        cached = CachedValue(func, default=0.35)
+
+        for _ in range(3):
+            self.assertEqual(0.35, cached())
+
+        # a failed fetch is retried instead of being cached for `timeout`
+        self.assertEqual(4, func.call_count)
+
+    def test_fallback_recovers(self):
+        """ Test that value is fetched once `func` stops raising `ConnectionError`. """
+        func = MagicMock(side_effect=[ConnectionError, 1])
+        cached = CachedValue(func, default=0.35)
+
+        self.assertEqual(1, cached())
+        self.assertEqual(1, cached())
+        self.assertEqual(2, func.call_count)
+
+    def test_lazy(self):
+        """ Test that `func` is not called until the value is first accessed. """
+        func = MagicMock(return_value=1)
+        cached = CachedValue(func, lazy=True)
+        func.assert_not_called()
+
+        self.assertEqual(1, cached())
+        func.assert_called_once()
+
+    def test_lazy_fallback(self):
+        """ Test that `default` is returned on every call when the first lazy fetch fails. """
+        func = MagicMock(side_effect=ConnectionError)
+        cached = CachedValue(func, default=0.35, lazy=True)
+
+        self.assertEqual(0.35, cached())
+        self.assertEqual(0.35, cached())
+        self.assertEqual(2, func.call_count)
+
+    def test_lazy_concurrent(self):
+        """ Test that concurrent callers of a lazy value only call `func` once. """
+        def _func():
+            time.sleep(0.05)
+            return 1
+        func = MagicMock(side_effect=_func)
+        cached = CachedValue(func, timeout=timedelta(minutes=1), lazy=True)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cached())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([1] * 8, results)
+        func.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()